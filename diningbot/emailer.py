@@ -12,8 +12,6 @@ from dotenv import load_dotenv
 load_dotenv()
 from supabase import create_client
 
-PERIOD_KEYS = ("breakfast", "lunch", "dinner")
-
 SUPABASE_URL = os.environ["SUPABASE_URL"]
 BASE_URL = os.environ["BASE_URL"]
 SUPABASE_SERVICE_ROLE_KEY = os.environ["SUPABASE_SERVICE_ROLE_KEY"]
@@ -74,25 +72,6 @@ def load_email_settings() -> EmailSettings:
     return settings
 
 
-def build_plain_text(subject: str, periods: dict[str, dine_api.Period]) -> str:  # type: ignore[attr-defined]
-    """Generate a plaintext companion for the email."""
-
-    lines = [subject, ""]
-    for key in PERIOD_KEYS:
-        period = periods.get(key)
-        if not period:
-            continue
-        lines.append(period.name or key.title())
-        for category in period.categories:
-            if not category.items:
-                continue
-            item_names = ", ".join(item.name for item in category.items if item.name)
-            if item_names:
-                label = category.name or "Misc"
-                lines.append(f"  {label}: {item_names}")
-        lines.append("")
-    return "\n".join(lines).strip()
-
 def send_email_helper(settings: EmailSettings, subject: str, html_body: str, text_body: str) -> None:
     """Send an email with HTML + plain-text parts."""
 
@@ -165,8 +144,11 @@ def send_email_to_one(recipient: str, html_body: str, date: str) -> None:
             client.login(settings.username, settings.password)
         client.sendmail(settings.sender, [recipient], message.as_string())
 
-def send_email(date: str, html_output: str, periods: dict[str, dine_api.Period]) -> None:  # type: ignore[attr-defined]
-    """Load email settings and dispatch the menu email."""
+def send_email(date: str, html_output: str, text_output: str) -> None:
+    """Load email settings and dispatch the menu email.
+
+    text_output is the plaintext body from render_html_and_text, without the subject line.
+    """
     store_daily_html(date, html_output)
     try:
         settings = load_email_settings()
@@ -174,5 +156,5 @@ def send_email(date: str, html_output: str, periods: dict[str, dine_api.Period])
         raise RuntimeError(f"Invalid email settings: {exc}") from exc
 
     subject = f"Dining Menu - {date}"
-    plain_text = build_plain_text(subject, periods)
+    plain_text = f"{subject}\n\n{text_output}".strip()
     send_email_helper(settings, subject, html_output, plain_text)
\ No newline at end of file
@@ -17,41 +17,56 @@ from diningbot.repeated_values import (
     PASTA_BAR_SIGNATURE,
 )
 
-def _handle_type1_unique(cat: dine_api.Category) -> dine_api.Category:
-    """
-    TYPE1: Always unique stations.
-    Just return as-is.
-    """
-    return cat
+_TYPE3 = frozenset({"the hot plate (teppanyaki)", "the hot plate", "fresh bowl", "create"})
+_TYPE2 = frozenset({"rise and dine", "the stacks", "leaf market", "grill house"})
+
+# per-station repeats filtered out of TYPE2 stations
+_TYPE2_SETS: Dict[str, frozenset[str]] = {
+    "rise and dine": RISE_AND_DINE,
+    "the stacks": STACKS,
+    "leaf market": LEAF_MARKET,
+    "grill house": GRILL_HOUSE,
+}
+
+# signature item -> station label for the first items of a TYPE3 station
+_SIG_TO_STATION: Dict[str, str] = {
+    sig: station
+    for sigs, station in (
+        # HOT PLATE
+        (TEPPAN_SIGNATURE, "Teppenyaki Station"),
+        (SHAWARMA_SIGNATURE, "Shawarma Station"),
+        (FRENCH_TOAST_SIGNATURE, "French Toast Bar"),
+        (PANCAKE_SIGNATURE, "Pancakes Bar"),
+        # FRESH BOWL
+        (RICE_BOWL_SIGNATURE, "Rice Bowl Bar"),
+        (MEZZE_BAR_SIGNATURE, "Mezze Bar"),
+        # CREATE
+        (RAMEN_BAR_SIGNATURE, "Ramen Station"),
+        (CURRY_BAR_SIGNATURE, "Curry Station"),
+    )
+    for sig in sigs
+}
 
 def _handle_type2_hybrid(cat: dine_api.Category) -> Optional[dine_api.Category]:
     """
     TYPE2: Hybrid stations.
     Filter repetitive items. If no specials left, omit this station.
     """
-    cname = norm(cat.name)
+    ignore = _TYPE2_SETS.get(norm(cat.name), frozenset())
     filtered_items = []
     seen = set()
 
     for item in cat.items:
         n = norm(item.name)
-        if n in seen:
+        if n in seen or n in ignore:
             continue
         seen.add(n)
-
-        if cname == "rise and dine" and n in RISE_AND_DINE:
-            continue
-        if cname == "the stacks" and n in STACKS:
-            continue
-        if cname == "leaf market" and n in LEAF_MARKET:
-            continue
-        if cname == "grill house" and n in GRILL_HOUSE:
-            continue
-
         filtered_items.append(item)
 
     if not filtered_items:
         return None
+    if len(filtered_items) == len(cat.items):
+        return cat  # nothing dropped
 
     return dine_api.Category(id=cat.id, name=cat.name, items=filtered_items)
 
@@ -60,32 +75,14 @@ def _handle_type3_morph(cat: dine_api.Category) -> dine_api.Category:
     TYPE3: Morph stations (Hot Plate, Fresh Bowl, Create).
     Detect what bar type it is today. Return only station title, no items.
     """
-    names = [norm(i.name) for i in cat.items]
-
-    # HOT PLATE
-    if any(sig in names[:3] for sig in TEPPAN_SIGNATURE):
-        station = "Teppenyaki Station"
-    elif any(sig in names[:3] for sig in SHAWARMA_SIGNATURE):
-        station = "Shawarma Station"
-    elif any(sig in names[:3] for sig in FRENCH_TOAST_SIGNATURE):
-        station = "French Toast Bar"
-    elif any(sig in names[:3] for sig in PANCAKE_SIGNATURE):
-        station = "Pancakes Bar"
-
-    # FRESH BOWL
-    elif any(sig in names[:3] for sig in RICE_BOWL_SIGNATURE):
-        station = "Rice Bowl Bar"
-    elif any(sig in names[:3] for sig in MEZZE_BAR_SIGNATURE):
-        station = "Mezze Bar"
-
-    # CREATE
-    elif any(sig in names[:3] for sig in RAMEN_BAR_SIGNATURE):
-        station = "Ramen Station"
-    elif any(sig in names[:3] for sig in CURRY_BAR_SIGNATURE):
-        station = "Curry Station"
-    elif any(sig in names for sig in PASTA_BAR_SIGNATURE):
-        station = "Pasta Station"
+    for item in cat.items[:3]:
+        station = _SIG_TO_STATION.get(norm(item.name))
+        if station:
+            return dine_api.Category(id=cat.id, name=station, items=[])
 
+    # CREATE: pasta sauces can show up anywhere in the list
+    if not PASTA_BAR_SIGNATURE.isdisjoint(norm(i.name) for i in cat.items):
+        station = "Pasta Station"
     else:
         station = cat.name  # fallback
 
@@ -101,27 +98,31 @@ def extract_specials(periods: Dict[str, dine_api.Period]) -> Dict[str, dine_api.
       - TYPE3: station name stays as header + classification appears as single bullet item
       - TYPE3 should always appear at the bottom of the period
     """
-    TYPE3 = {"the hot plate (teppanyaki)", "the hot plate", "fresh bowl", "create"}
-    TYPE2 = {"rise and dine", "the stacks", "leaf market", "grill house"}
-
+    item_cls = dine_api.MenuItem
     out: Dict[str, dine_api.Period] = {}
 
     for period_key, period in periods.items():
         if not period:
             continue
 
+        is_breakfast = period_key.lower() == "breakfast"
         type1_and_type2: list[dine_api.Category] = []
         type3_list: list[dine_api.Category] = []
 
         for cat in period.categories:
             cname_norm = norm(cat.name)
 
-            if cname_norm in TYPE3:
+            # BREAKFAST filter: only Rise & Dine
+            if is_breakfast and cname_norm != "rise and dine":
+                continue
+
+            if cname_norm in _TYPE3:
+                # nothing to classify; omit the station like an emptied TYPE2
+                if not cat.items:
+                    continue
                 morph = _handle_type3_morph(cat)
                 # classification = morph.name (station classification we detected)
                 classification = morph.name
-                # make bullet item object using same class
-                item_cls = cat.items[0].__class__
                 type3_list.append(
                     dine_api.Category(
                         id=cat.id,
@@ -132,21 +133,20 @@ def extract_specials(periods: Dict[str, dine_api.Period]) -> Dict[str, dine_api.
                 continue
 
             # TYPE2 hybrid (remove repeats)
-            if cname_norm in TYPE2:
+            if cname_norm in _TYPE2:
                 new_cat = _handle_type2_hybrid(cat)
                 if new_cat:
                     type1_and_type2.append(new_cat)
                 continue
 
-            # TYPE1 passthrough
-            type1_and_type2.append(_handle_type1_unique(cat))
+            # TYPE1 passthrough (always unique stations)
+            type1_and_type2.append(cat)
 
         # merge in final order: TYPE1+TYPE2 then TYPE3 at end
         new_cats = type1_and_type2 + type3_list
-
-        # BREAKFAST filter: only Rise & Dine
-        if period_key.lower() == "breakfast":
-            new_cats = [c for c in new_cats if norm(c.name) == "rise and dine"]
+        if new_cats == period.categories:
+            out[period_key] = period  # nothing filtered or reordered
+            continue
 
         out[period_key] = dine_api.Period(
             id=period.id,
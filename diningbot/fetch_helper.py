@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import datetime as _dt
+import hashlib
 import logging
+import os
+import re
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 _logger = logging.getLogger(__name__)
 
@@ -15,25 +24,45 @@ BASE_URL = "https://api.dineoncampus.ca/v1"
 DEFAULT_LOCATION_ID = "63fd054f92d6b41e84b6c30e"
 PERIOD_KEYS = ("breakfast", "lunch", "dinner")
 
+# one keep-alive session shared by every call so the period fan-out reuses
+# the same TLS connection instead of handshaking per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+_SESSION.headers.update(
+    {
+        "User-Agent": "DiningBot/0.2",
+        "Accept": "application/json, text/plain, */*",
+    }
+)
+
+# raw API responses are cached on disk; days at least IMMUTABLE_AFTER_DAYS old
+# never change, newer ones are revalidated (ETag / Last-Modified) once older
+# than CACHE_TTL_SECONDS
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "diningbot"
+CACHE_TTL_SECONDS = 6 * 60 * 60
+# callers pass the Pacific date while the host clock may be UTC, so allow a
+# day of skew before treating a menu as final
+IMMUTABLE_AFTER_DAYS = 2
+
 
 class ApiError(RuntimeError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuItem:
     name: str
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     id: Optional[str]
     name: str
     items: List[MenuItem]
 
 
-@dataclass
+@dataclass(slots=True)
 class Period:
     id: Optional[str]
     name: str
@@ -41,53 +70,122 @@ class Period:
     categories: List[Category]
 
 
-@dataclass
+@dataclass(slots=True)
 class Menu:
     date: str
     periods: List[Period]
 
 
 def _ensure_list(value: Any) -> List[Any]:
+    if type(value) is list:
+        return value
     if value is None:
         return []
-    if isinstance(value, list):
-        return value
     return [value]
 
 
-def fetch_menu(location_id: str, *, date: Optional[str] = None, platform: int = 0, timeout: int = 20) -> Dict[str, Any]:
-    """Fetch raw menu JSON for a given location and date.
+def _cache_dir() -> Path:
+    # read at call time so DININGBOT_CACHE_DIR from .env (loaded after import) applies
+    return Path(os.environ.get("DININGBOT_CACHE_DIR") or DEFAULT_CACHE_DIR)
 
-    - location_id: API location identifier
-    - date: YYYY-MM-DD; defaults to today in local time
-    - platform: API expects an integer platform flag (0 works for web)
-    """
 
-    if not date:
-        date = _dt.date.today().isoformat()
+def _cache_path(location_id: str, period_id: str, date: str, platform: int) -> Path:
+    key = hashlib.sha1(f"{location_id}|{period_id}|{date}|{platform}".encode()).hexdigest()
+    return _cache_dir() / f"{key}.json"
+
+
+def _load_cached(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the cached entry ({"data", "etag", "last_modified"}) at path, if any."""
+    try:
+        entry = orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("data"), dict):
+        return None
+    return entry
+
+
+def _is_fresh(path: Path, date: str) -> bool:
+    cutoff = _dt.date.today() - _dt.timedelta(days=IMMUTABLE_AFTER_DAYS)
+    if date <= cutoff.isoformat():
+        return True
+    try:
+        return time.time() - path.stat().st_mtime <= CACHE_TTL_SECONDS
+    except OSError:
+        return False
+
+
+def _store_cached(path: Path, entry: Dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(orjson.dumps(entry))
+        tmp.replace(path)
+    except OSError as exc:
+        _logger.warning("Failed to cache response at %s: %s", path, exc)
+
+
+def _get_json(url: str, params: Dict[str, Any], *, cache_path: Path, date: str, timeout: int) -> Dict[str, Any]:
+    """GET url through the disk cache, revalidating stale entries with their validators."""
+    entry = _load_cached(cache_path)
+    if entry is not None and _is_fresh(cache_path, date):
+        return entry["data"]
+
+    headers: Dict[str, str] = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
 
-    url = f"{BASE_URL}/location/{location_id}/periods"
-    params = {"platform": platform, "date": date}
-    headers = {
-        "User-Agent": "DiningBot/0.2",
-        "Accept": "application/json, text/plain, */*",
-    }
     _logger.info("GET %s params=%s", url, params)
     try:
-        resp = requests.get(url, params=params, headers=headers, timeout=timeout)
+        resp = _SESSION.get(url, params=params, headers=headers, timeout=timeout)
     except requests.RequestException as exc:
         raise ApiError(f"Failed request to {url}") from exc
 
+    if resp.status_code == 304 and entry is not None:
+        # unchanged upstream: keep the cached body and restart its TTL
+        try:
+            cache_path.touch()
+        except OSError:
+            pass
+        return entry["data"]
+
     ct = resp.headers.get("Content-Type", "")
     if resp.status_code != 200 or "application/json" not in ct:
         raise ApiError(f"Unexpected response {resp.status_code} {ct}: {resp.text[:200]}")
 
-    data = resp.json()
+    data = orjson.loads(resp.content)
     if data.get("status") != "success":
         raise ApiError(f"API error: {data}")
+    _store_cached(
+        cache_path,
+        {
+            "data": data,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        },
+    )
     return data
 
 
+def fetch_menu(location_id: str, *, date: Optional[str] = None, platform: int = 0, timeout: int = 20) -> Dict[str, Any]:
+    """Fetch raw menu JSON for a given location and date.
+
+    - location_id: API location identifier
+    - date: YYYY-MM-DD; defaults to today in local time
+    - platform: API expects an integer platform flag (0 works for web)
+    """
+
+    if not date:
+        date = _dt.date.today().isoformat()
+
+    url = f"{BASE_URL}/location/{location_id}/periods"
+    params = {"platform": platform, "date": date}
+    return _get_json(url, params, cache_path=_cache_path(location_id, "", date, platform), date=date, timeout=timeout)
+
+
 def parse_menu(data: Dict[str, Any]) -> Menu:
     """Convert raw JSON into typed dataclasses with tolerant shape handling."""
     menu = data.get("menu") or {}
@@ -95,21 +193,23 @@ def parse_menu(data: Dict[str, Any]) -> Menu:
     periods_raw = _ensure_list(menu.get("periods"))
     periods: List[Period] = []
     for p in periods_raw:
-        pid = (p or {}).get("id")
-        name = (p or {}).get("name", "")
-        order = int((p or {}).get("sort_order", 0) or 0)
-        categories_raw = _ensure_list((p or {}).get("categories"))
+        p = p or {}
+        pid = p.get("id")
+        name = p.get("name", "")
+        order = int(p.get("sort_order", 0) or 0)
+        categories_raw = _ensure_list(p.get("categories"))
         categories: List[Category] = []
         for c in categories_raw:
-            cid = (c or {}).get("id")
-            cname = (c or {}).get("name", "")
-            items_raw = _ensure_list((c or {}).get("items"))
+            c = c or {}
+            cid = c.get("id")
+            cname = c.get("name", "")
+            items_raw = _ensure_list(c.get("items"))
             items: List[MenuItem] = []
             for it in items_raw:
                 if not it:
                     continue
-                iname = (it or {}).get("name") or (it or {}).get("item") or ""
-                idesc = (it or {}).get("description")
+                iname = it.get("name") or it.get("item") or ""
+                idesc = it.get("description")
                 items.append(MenuItem(name=iname, description=idesc))
             categories.append(Category(id=cid, name=cname, items=items))
         periods.append(Period(id=pid, name=name, sort_order=order, categories=categories))
@@ -127,24 +227,7 @@ def fetch_period(location_id: str, period_id: str, *, date: Optional[str] = None
 
     url = f"{BASE_URL}/location/{location_id}/periods/{period_id}"
     params = {"platform": platform, "date": date}
-    headers = {
-        "User-Agent": "DiningBot/0.2",
-        "Accept": "application/json, text/plain, */*",
-    }
-    _logger.info("GET %s params=%s", url, params)
-    try:
-        resp = requests.get(url, params=params, headers=headers, timeout=timeout)
-    except requests.RequestException as exc:
-        raise ApiError(f"Failed request to {url}") from exc
-
-    ct = resp.headers.get("Content-Type", "")
-    if resp.status_code != 200 or "application/json" not in ct:
-        raise ApiError(f"Unexpected response {resp.status_code} {ct}: {resp.text[:200]}")
-
-    data = resp.json()
-    if data.get("status") != "success":
-        raise ApiError(f"API error: {data}")
-    return data
+    return _get_json(url, params, cache_path=_cache_path(location_id, period_id, date, platform), date=date, timeout=timeout)
 
 
 def parse_period(data: Dict[str, Any]) -> Period:
@@ -177,18 +260,30 @@ def parse_period(data: Dict[str, Any]) -> Period:
         for it in items_raw:
             if not it:
                 continue
-            iname = (it or {}).get("name") or (it or {}).get("item") or ""
-            idesc = (it or {}).get("description")
+            iname = it.get("name") or it.get("item") or ""
+            idesc = it.get("description")
             items.append(MenuItem(name=iname, description=idesc))
         categories.append(Category(id=cid, name=cname, items=items))
     return Period(id=pid, name=name, sort_order=order, categories=categories)
 
+# \w is str.isalnum() plus "_", so this strips exactly the non-alphanumerics
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+
+@lru_cache(maxsize=64)
 def _normalize_period_name(name: str) -> str:
-    return "".join(ch.lower() for ch in name if ch.isalnum())
+    return _NON_ALNUM_RE.sub("", name).lower()
+
 
+_NORM_PERIOD_KEYS = tuple((key, _normalize_period_name(key)) for key in PERIOD_KEYS)
 
-def resolve_period_ids(date: str) -> Dict[str, str]:
-    """Resolve dynamic period IDs by matching names from the daily menu."""
+
+@lru_cache(maxsize=8)
+def resolve_period_ids(date: str) -> Mapping[str, str]:
+    """Resolve dynamic period IDs by matching names from the daily menu.
+
+    Results are memoized per date and returned read-only; failures are not cached.
+    """
 
     matches: Dict[str, str] = {}
     try:
@@ -221,13 +316,17 @@ def resolve_period_ids(date: str) -> Dict[str, str]:
                         continue
                     matches[_normalize_period_name(period.name)] = period.id
 
+    # substring fallback ("breakfastbuffet" -> breakfast), first match wins
+    contains: Dict[str, str] = {}
+    for name_norm, pid in matches.items():
+        for key, norm in _NORM_PERIOD_KEYS:
+            if norm in name_norm:
+                contains.setdefault(key, pid)
+
     resolved: Dict[str, str] = {}
     missing: list[str] = []
-    for key in PERIOD_KEYS:
-        norm = _normalize_period_name(key)
-        pid = matches.get(norm)
-        if pid is None:
-            pid = next((pid for name_norm, pid in matches.items() if norm in name_norm), None)
+    for key, norm in _NORM_PERIOD_KEYS:
+        pid = matches.get(norm) or contains.get(key)
         if pid:
             resolved[key] = pid
         else:
@@ -242,4 +341,4 @@ def resolve_period_ids(date: str) -> Dict[str, str]:
         )
         raise RuntimeError(f"Missing period ids: {', '.join(missing)}")
 
-    return resolved
+    return MappingProxyType(resolved)
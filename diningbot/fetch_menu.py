@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from diningbot import fetch_helper as dine_api
-
-DEFAULT_LOCATION_ID = "63fd054f92d6b41e84b6c30e"
-PERIOD_KEYS = ("breakfast", "lunch", "dinner")
+from diningbot.fetch_helper import DEFAULT_LOCATION_ID, PERIOD_KEYS
 
 _logger = logging.getLogger(__name__)
 
+# reused across calls so a long-running scheduler doesn't spin up threads per run
+_EXECUTOR = ThreadPoolExecutor(max_workers=max(len(PERIOD_KEYS), 3), thread_name_prefix="diningbot")
+atexit.register(_EXECUTOR.shutdown)
+
 def fetch_daily_menu(date: str) -> dict[str, dine_api.Period]:  # type: ignore[attr-defined]
     """Fetch and parse each dining period for the given date."""
 
@@ -20,25 +23,22 @@ def fetch_daily_menu(date: str) -> dict[str, dine_api.Period]:  # type: ignore[a
     if not period_ids:
         raise RuntimeError("No period ids resolved")
 
-    parsed_periods: dict[str, dine_api.Period] = {}  # type: ignore[attr-defined]
-
-    def _fetch(key: str, period_id: str) -> tuple[str, dict]:
+    def _fetch(period_id: str) -> dine_api.Period:  # type: ignore[attr-defined]
+        # parse inside the worker so it overlaps the other in-flight requests
         data = dine_api.fetch_period(DEFAULT_LOCATION_ID, period_id, date=date, platform=0)
-        return key, data
-
-    with ThreadPoolExecutor(max_workers=len(period_ids)) as executor:
-        futures = {executor.submit(_fetch, key, pid): key for key, pid in period_ids.items()}
-        for future in as_completed(futures):
-            key = futures[future]
-            try:
-                _, data = future.result()
-            except dine_api.ApiError as exc:  # type: ignore[attr-defined]
-                raise RuntimeError(f"API error retrieving {key}: {exc}") from exc
-            parsed_periods[key] = dine_api.parse_period(data)
+        return dine_api.parse_period(data)
 
+    futures = {key: _EXECUTOR.submit(_fetch, pid) for key, pid in period_ids.items()}
+
+    # all requests are already in flight; collect them in meal order
     ordered_periods: dict[str, dine_api.Period] = {}  # type: ignore[attr-defined]
     for key in PERIOD_KEYS:
-        if key in parsed_periods:
-            ordered_periods[key] = parsed_periods[key]
-
-    return ordered_periods
\ No newline at end of file
+        future = futures.get(key)
+        if future is None:
+            continue
+        try:
+            ordered_periods[key] = future.result()
+        except dine_api.ApiError as exc:  # type: ignore[attr-defined]
+            raise RuntimeError(f"API error retrieving {key}: {exc}") from exc
+
+    return ordered_periods
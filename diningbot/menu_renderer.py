@@ -2,180 +2,237 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from html import escape
 from typing import Dict
 
 from diningbot import fetch_helper as dine_api
 
-
-def render_html(date: str, period_map: Dict[str, dine_api.Period]) -> str:  # type: ignore[attr-defined]
-    """Return styled HTML for the supplied periods keyed by meal names."""
-
-    # Palette
-    OUTER_BG = "#141313"
-    CONTAINER_BG = "#1B1A19"
-    BORDER = "#6B5E4B" 
-    ACCENT = "#D7B47E"   
-    H1_COLOR = "#E9DFC8"   
-    TEXT = "#D9D4C7"       
-    MUTED = "#C8C3B6"       
-    TINTS = {
-        "breakfast": "#D7B47E",  # golden beige
-        "lunch": "#6B5E4B",      # coffee grey-brown
-        "dinner": "#2B2122",     # deep plum-brown
-    }
-
-    def table_section(period_key: str, period: dine_api.Period) -> str:  # type: ignore[attr-defined]
-        """Return a dark-themed section for one meal period."""
-        header = escape(period.name or period_key.title())
-        tint = TINTS.get(period_key.lower(), BORDER)
-
-        rows: list[str] = []
-
-        # Section header (thin divider + label)
-        rows.append(
-            "<tr>"
-            f"<td style=\"padding:18px 0 8px 0;border-top:1px solid {BORDER};\">"
-            f"<h2 style=\"margin:0;font-family:Georgia,'Times New Roman',serif;"
-            f"font-size:20px;line-height:26px;color:{H1_COLOR};font-weight:600;"
-            f"letter-spacing:0.2px;text-align:left;\">"
-            # tinted pill before header text
-            f"<span style=\"display:inline-block;width:10px;height:10px;border-radius:50%;"
-            f"background:{tint};vertical-align:middle;margin-right:10px;\"></span>"
-            f"{header}"
-            f"</h2>"
-            "</td>"
-            "</tr>"
+# menu vocabulary is small and repeats across periods, so memoize escaping
+_esc = lru_cache(maxsize=2048)(escape)
+
+# Palette
+OUTER_BG = "#141313"
+CONTAINER_BG = "#1B1A19"
+BORDER = "#6B5E4B"
+ACCENT = "#D7B47E"
+H1_COLOR = "#E9DFC8"
+TEXT = "#D9D4C7"
+MUTED = "#C8C3B6"
+TINTS = {
+    "breakfast": "#D7B47E",  # golden beige
+    "lunch": "#6B5E4B",      # coffee grey-brown
+    "dinner": "#2B2122",     # deep plum-brown
+}
+
+# Inline styles that never change between renders
+_SECTION_TD_STYLE = f"padding:18px 0 8px 0;border-top:1px solid {BORDER};"
+_SECTION_H2_STYLE = (
+    "margin:0;font-family:Georgia,'Times New Roman',serif;"
+    f"font-size:20px;line-height:26px;color:{H1_COLOR};font-weight:600;"
+    "letter-spacing:0.2px;text-align:left;"
+)
+_PILL_STYLE = "display:inline-block;width:10px;height:10px;border-radius:50%;"
+_CATEGORY_DIV_STYLE = (
+    f"display:inline-block;padding:6px 10px;border:1px solid {BORDER};"
+    f"border-radius:14px;color:{MUTED};font-family:'Helvetica Neue',Arial,sans-serif;"
+    "font-size:12px;line-height:16px;"
+)
+_ITEMS_TD_STYLE = (
+    "vertical-align:top;padding:6px 0 10px 0;"
+    f"color:{TEXT};font-family:'Helvetica Neue',Arial,sans-serif;"
+    "font-size:14px;line-height:22px;"
+)
+_DESCRIPTION_STYLE = f"color:{MUTED};font-size:12px;"
+_EMPTY_TD_STYLE = (
+    f"padding:10px 0;color:{TEXT};font-family:'Helvetica Neue',Arial,sans-serif;"
+    "font-size:14px;line-height:22px;"
+)
+
+# Row shapes for a period section, filled in with str.format
+_ROW_SECTION_HEADER = (
+    "<tr>"
+    f"<td style=\"{_SECTION_TD_STYLE}\">"
+    f"<h2 style=\"{_SECTION_H2_STYLE}\">"
+    # tinted pill before header text
+    f"<span style=\"{_PILL_STYLE}"
+    "background:{tint};vertical-align:middle;margin-right:10px;\"></span>"
+    "{header}"
+    "</h2>"
+    "</td>"
+    "</tr>"
+)
+_ROW_CATEGORY = (
+    "<tr>"
+    "<td style=\"padding:10px 0 4px 0;\">"
+    f"<div style=\"{_CATEGORY_DIV_STYLE}\">{{name}}</div>"
+    "</td>"
+    "</tr>"
+)
+_ROW_ITEMS = (
+    "<tr>"
+    f"<td style=\"{_ITEMS_TD_STYLE}\">{{items}}</td>"
+    "</tr>"
+)
+_ITEM_PLAIN = "• {name}"
+_ITEM_WITH_DESC = f"• {{name}} <span style='{_DESCRIPTION_STYLE}'>- {{desc}}</span>"
+_ROW_EMPTY = (
+    "<tr>"
+    f"<td style=\"{_EMPTY_TD_STYLE}\">"
+    "Menu details are not available for this period."
+    "</td>"
+    "</tr>"
+)
+
+# Header block: “Today's Specials” (no date, no hero)
+_HEADER_BLOCK = (
+    "<tr>"
+    f"<td style=\"padding:24px 20px 12px 20px;background-color:{CONTAINER_BG};\">"
+    f"<h1 style=\"margin:0;font-family:Georgia,'Times New Roman',serif;font-size:28px;line-height:34px;"
+    f"color:{H1_COLOR};font-weight:700;text-align:center;\">Today's Specials</h1>"
+    "</td>"
+    "</tr>"
+)
+
+# Optional top utility line (right-aligned)
+_VIEW_IN_BROWSER = (
+    "<tr>"
+    f"<td style=\"padding:10px 16px;background-color:{CONTAINER_BG};border-bottom:1px solid {BORDER};\">"
+    f"<p style=\"margin:0;font-family:'Helvetica Neue',Arial,sans-serif;font-size:12px;line-height:18px;"
+    f"color:{TEXT};text-align:right;\">"
+    "</p>"
+    "</td>"
+    "</tr>"
+)
+
+# Footer divider (subtle)
+_FOOTER = (
+    "<tr>"
+    f"<td style=\"padding:0 24px;background-color:{CONTAINER_BG};\">"
+    "<table role=\"presentation\" cellpadding=\"0\" cellspacing=\"0\" border=\"0\" width=\"100%\">"
+    f"<tr><td style=\"border-top:1px solid {BORDER};line-height:0;font-size:0;\">&nbsp;</td></tr>"
+    "</table>"
+    "</td>"
+    "</tr>"
+)
+
+# Everything up to the <title> line
+_DOC_PREFIX = (
+    "<!DOCTYPE html>\n"
+    "<html lang=\"en\">\n"
+    "<head>\n"
+    "  <meta charset=\"utf-8\">\n"
+    "  <meta http-equiv=\"x-ua-compatible\" content=\"ie=edge\">\n"
+    "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">\n"
+    "  <meta name=\"color-scheme\" content=\"only dark\">\n"
+    "  <meta name=\"supported-color-schemes\" content=\"dark\">\n"
+)
+
+# From </head> up to where the period sections start
+_BODY_OPEN = (
+    "</head>\n"
+    # Full-width dark background + centered container
+    f"<body style=\"margin:0;padding:24px;background-color:{OUTER_BG};"
+    "font-family:Arial,Helvetica,sans-serif;\">\n"
+    "  <center style=\"width:100%;\">\n"
+    # Outer container (gold border card on dark background)
+    "    <table role=\"presentation\" cellpadding=\"0\" cellspacing=\"0\" border=\"0\" width=\"100%\" "
+    f"style=\"max-width:600px;width:100%;background-color:{CONTAINER_BG};border:1px solid {BORDER};\">"
+    f"{_VIEW_IN_BROWSER}"
+    f"{_HEADER_BLOCK}"
+    # (No hero image row by design)
+    # Inner content table (holds all sections)
+    "<tr>"
+    f"<td style=\"padding:0 24px 24px 24px;background-color:{CONTAINER_BG};\">"
+    "<table role=\"presentation\" cellpadding=\"0\" cellspacing=\"0\" border=\"0\" width=\"100%\" "
+    "style=\"border-collapse:separate;border-spacing:0;\">"
+)
+
+# Closes the section table and the document
+_DOC_SUFFIX = (
+    "</table>"
+    "</td>"
+    "</tr>"
+    f"{_FOOTER}"
+    "</table>\n"
+    # Breathing room spacer for small screens
+    "    <table role=\"presentation\" cellpadding=\"0\" cellspacing=\"0\" border=\"0\" width=\"100%\" "
+    "style=\"max-width:600px;\">"
+    "      <tr><td style=\"line-height:1px;font-size:1px;\">&nbsp;</td></tr>"
+    "    </table>\n"
+    "  </center>\n"
+    "</body>\n"
+    "</html>"
+)
+
+
+def _items_markup(category: dine_api.Category, text_lines: list[str]) -> str:  # type: ignore[attr-defined]
+    """Return the bullet list for one category, one item per line.
+
+    The plaintext summary line for the category is appended to text_lines.
+    """
+    items_markup = []
+    item_names = []
+    for item in category.items:
+        name = _esc(item.name or "Unnamed item")
+        items_markup.append(
+            _ITEM_WITH_DESC.format(name=name, desc=_esc(item.description))
+            if item.description
+            else _ITEM_PLAIN.format(name=name)
         )
+        if item.name:
+            item_names.append(item.name)
+    if item_names:
+        text_lines.append(f"  {category.name or 'Misc'}: {', '.join(item_names)}")
+    return "<br>".join(items_markup)
+
+
+def _table_section(period_key: str, period: dine_api.Period, text_lines: list[str]) -> str:  # type: ignore[attr-defined]
+    """Return a dark-themed section for one meal period, adding its plaintext to text_lines."""
+    label = period.name or period_key.title()
+    text_lines.append(label)
+
+    # Section header (thin divider + label)
+    header_row = _ROW_SECTION_HEADER.format(
+        tint=TINTS.get(period_key, BORDER),
+        header=_esc(label),
+    )
+
+    if not period.categories:
+        text_lines.append("")
+        return f"{header_row}{_ROW_EMPTY}"
 
-        if period.categories:
-            for category in period.categories:
-                cat_name = escape(category.name or "Miscellaneous")
-
-                # Category subheading
-                rows.append(
-                    "<tr>"
-                    f"<td style=\"padding:10px 0 4px 0;\">"
-                    f"<div style=\"display:inline-block;padding:6px 10px;border:1px solid {BORDER};"
-                    f"border-radius:14px;color:{MUTED};font-family:'Helvetica Neue',Arial,sans-serif;"
-                    f"font-size:12px;line-height:16px;\">{cat_name}</div>"
-                    "</td>"
-                    "</tr>"
-                )
-
-                # Items list
-                items_markup = []
-                for item in category.items:
-                    text = escape(item.name or "Unnamed item")
-                    if item.description:
-                        text += (
-                            f" <span style='color:{MUTED};font-size:12px;'>"
-                            f"- {escape(item.description)}</span>"
-                        )
-                    items_markup.append(f"• {text}")
-
-                rows.append(
-                    "<tr>"
-                    f"<td style=\"vertical-align:top;padding:6px 0 10px 0;"
-                    f"color:{TEXT};font-family:'Helvetica Neue',Arial,sans-serif;"
-                    f"font-size:14px;line-height:22px;\">{'<br>'.join(items_markup)}</td>"
-                    "</tr>"
-                )
-        else:
-            rows.append(
-                "<tr>"
-                f"<td style=\"padding:10px 0;color:{TEXT};font-family:'Helvetica Neue',Arial,sans-serif;"
-                "font-size:14px;line-height:22px;\">"
-                "Menu details are not available for this period."
-                "</td>"
-                "</tr>"
-            )
-
-        return "".join(rows)
-
-    # Build all period sections (order preserved; no functional changes)
-    sections = [
-        table_section(key, period)
-        for key, period in period_map.items()
-        if period
+    # Category subheading followed by its items list
+    cat_blocks = [
+        f"{_ROW_CATEGORY.format(name=_esc(category.name or 'Miscellaneous'))}"
+        f"{_ROW_ITEMS.format(items=_items_markup(category, text_lines))}"
+        for category in period.categories
     ]
+    text_lines.append("")
+    return f"{header_row}{''.join(cat_blocks)}"
 
-    # Header block: “Today's Specials” (no date, no hero)
-    header_block = (
-        "<tr>"
-        f"<td style=\"padding:24px 20px 12px 20px;background-color:{CONTAINER_BG};\">"
-        f"<h1 style=\"margin:0;font-family:Georgia,'Times New Roman',serif;font-size:28px;line-height:34px;"
-        f"color:{H1_COLOR};font-weight:700;text-align:center;\">Today's Specials</h1>"
-        "</td>"
-        "</tr>"
-    )
 
-    # Optional top utility line (right-aligned)
-    view_in_browser = (
-        "<tr>"
-        f"<td style=\"padding:10px 16px;background-color:{CONTAINER_BG};border-bottom:1px solid {BORDER};\">"
-        f"<p style=\"margin:0;font-family:'Helvetica Neue',Arial,sans-serif;font-size:12px;line-height:18px;"
-        f"color:{TEXT};text-align:right;\">"
-        "</p>"
-        "</td>"
-        "</tr>"
-    )
+def render_html_and_text(date: str, period_map: Dict[str, dine_api.Period]) -> tuple[str, str]:  # type: ignore[attr-defined]
+    """Return styled HTML and its plaintext companion, walking the periods once."""
+    text_lines: list[str] = []
 
-    # Inner content table (holds all sections)
-    inner_content = (
-        "<tr>"
-        f"<td style=\"padding:0 24px 24px 24px;background-color:{CONTAINER_BG};\">"
-        "<table role=\"presentation\" cellpadding=\"0\" cellspacing=\"0\" border=\"0\" width=\"100%\" "
-        "style=\"border-collapse:separate;border-spacing:0;\">"
-        f"{''.join(sections) if sections else ''}"
-        "</table>"
-        "</td>"
-        "</tr>"
-    )
+    def iter_html():
+        """Yield the document in order so it is joined in a single pass."""
+        yield _DOC_PREFIX
+        yield f"  <title>SFU Dining - {_esc(date)}</title>\n"
+        yield _BODY_OPEN
 
-    # Outer container (gold border card on dark background)
-    container_table = (
-        "<table role=\"presentation\" cellpadding=\"0\" cellspacing=\"0\" border=\"0\" width=\"100%\" "
-        f"style=\"max-width:600px;width:100%;background-color:{CONTAINER_BG};border:1px solid {BORDER};\">"
-        f"{view_in_browser}"
-        f"{header_block}"
-        # (No hero image row by design)
-        f"{inner_content}"
-        # Footer divider (subtle)
-        "<tr>"
-        f"<td style=\"padding:0 24px;background-color:{CONTAINER_BG};\">"
-        "<table role=\"presentation\" cellpadding=\"0\" cellspacing=\"0\" border=\"0\" width=\"100%\">"
-        f"<tr><td style=\"border-top:1px solid {BORDER};line-height:0;font-size:0;\">&nbsp;</td></tr>"
-        "</table>"
-        "</td>"
-        "</tr>"
-        "</table>"
-    )
+        # All period sections (order preserved)
+        for key, period in period_map.items():
+            if period:
+                yield _table_section(key, period, text_lines)
 
-    html_parts = [
-        "<!DOCTYPE html>",
-        "<html lang=\"en\">",
-        "<head>",
-        "  <meta charset=\"utf-8\">",
-        "  <meta http-equiv=\"x-ua-compatible\" content=\"ie=edge\">",
-        "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">",
-        "  <meta name=\"color-scheme\" content=\"only dark\">",
-        "  <meta name=\"supported-color-schemes\" content=\"dark\">",
-        f"  <title>SFU Dining - {escape(date)}</title>",
-        "</head>",
-        # Full-width dark background + centered container
-        f"<body style=\"margin:0;padding:24px;background-color:{OUTER_BG};"
-        "font-family:Arial,Helvetica,sans-serif;\">",
-        "  <center style=\"width:100%;\">",
-        f"    {container_table}",
-        # Breathing room spacer for small screens
-        "    <table role=\"presentation\" cellpadding=\"0\" cellspacing=\"0\" border=\"0\" width=\"100%\" "
-        "style=\"max-width:600px;\">"
-        "      <tr><td style=\"line-height:1px;font-size:1px;\">&nbsp;</td></tr>"
-        "    </table>",
-        "  </center>",
-        "</body>",
-        "</html>",
-    ]
+        yield _DOC_SUFFIX
 
-    return "\n".join(html_parts)
+    html = "".join(iter_html())
+    return html, "\n".join(text_lines).strip()
+
+
+def render_html(date: str, period_map: Dict[str, dine_api.Period]) -> str:  # type: ignore[attr-defined]
+    """Return styled HTML for the supplied periods keyed by meal names."""
+    return render_html_and_text(date, period_map)[0]
@@ -1,9 +1,13 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
 def norm(text: str) -> str:
     return " ".join((text or "").strip().lower().split())
 
 
 # PER-STATION REPEATS
-RISE_AND_DINE = {
+RISE_AND_DINE = frozenset({
     norm("Fresh Cooked Eggs"),
     norm("Scrambled Eggs"),
     norm("Blueberry Danish"),
@@ -18,9 +22,9 @@ RISE_AND_DINE = {
     norm("Basic Whole Wheat Muffin"),
     norm("Cheddar Cheese Scone"),
     norm("McFraser Breakfast Sandwich"),
-}
+})
 
-STACKS = {
+STACKS = frozenset({
     norm("Side of Sliced Tomato"),
     norm("Leaf Lettuce"),
     norm("Sliced Red Onions"),
@@ -45,9 +49,9 @@ STACKS = {
     norm("BBQ Sauce"),
     norm("Cheddar Cheese Slices, Medium"),
     norm("Whole Wheat Bread, Slice"),
-}
+})
 
-LEAF_MARKET = {
+LEAF_MARKET = frozenset({
     norm("Deluxe Fruit Salad"),
     norm("Chopped Romaine"),
     norm("Diced Tomatoes"),
@@ -70,9 +74,9 @@ LEAF_MARKET = {
     norm("Caesar Salad Dressing"),
     norm("CW Ranch Salad Dressing"),
     norm("Balsamic Salad Dressing"),
-}
+})
 
-GRILL_HOUSE = {
+GRILL_HOUSE = frozenset({
     norm("Leaf Lettuce"),
     norm("Side of Sliced Tomato"),
     norm("Cucumber Pickles"),
@@ -86,53 +90,53 @@ GRILL_HOUSE = {
     norm("Mild Chunky Salsa"),
     norm("Sour Cream"),
     norm("Chicken Tender Strips"),
-}
+})
 
 # ===========================================
 # Hot Plate
-TEPPAN_SIGNATURE = {
+TEPPAN_SIGNATURE = frozenset({
     norm("jasmine rice"),
     norm("cantonese style chow mein noodles"),
-}
+})
 
-SHAWARMA_SIGNATURE = {
+SHAWARMA_SIGNATURE = frozenset({
     norm("chicken shawarma"),
-}
+})
 
-FRENCH_TOAST_SIGNATURE = {
+FRENCH_TOAST_SIGNATURE = frozenset({
     norm("french toast"),
-}
+})
 
-PANCAKE_SIGNATURE = {
+PANCAKE_SIGNATURE = frozenset({
     norm("pancakes"),
     norm("pancake"),
-}
+})
 
 # Fresh Bowl
-RICE_BOWL_SIGNATURE = {
+RICE_BOWL_SIGNATURE = frozenset({
     norm("bbq chicken"),
     norm("chili con carne"),
-}
+})
 
-MEZZE_BAR_SIGNATURE = {
+MEZZE_BAR_SIGNATURE = frozenset({
     norm("tzatziki"),
     norm("hummus"),
-}
+})
 
 # Create
-RAMEN_BAR_SIGNATURE = {
+RAMEN_BAR_SIGNATURE = frozenset({
     norm("ramen noodles"),
     norm("udon noodles"),
-}
+})
 
-CURRY_BAR_SIGNATURE = {
+CURRY_BAR_SIGNATURE = frozenset({
     norm("rice pilaf"),
     norm("green curry base"),
     norm("indonesian beef curry"),
     norm("rajma curry"),
-}
+})
 
-PASTA_BAR_SIGNATURE = {
+PASTA_BAR_SIGNATURE = frozenset({
     norm("garlic cream cheese sauce"),
     norm("sun-dried tomato sauce"),
-}
+})
@@ -10,7 +10,7 @@ from dotenv import load_dotenv
 
 from diningbot.fetch_menu import fetch_daily_menu
 from diningbot.extraction import extract_specials
-from diningbot.menu_renderer import render_html
+from diningbot.menu_renderer import render_html_and_text
 from diningbot.emailer import (
     load_cached_email_html,
     send_email,
@@ -43,10 +43,10 @@ def _run_daily() -> int:
         _logger.error("Failed to fetch periods for %s: %s", date, exc)
         return 1
 
-    html_output = render_html(date, periods)
+    html_output, text_output = render_html_and_text(date, periods)
 
     try:
-        send_email(date, html_output, periods)
+        send_email(date, html_output, text_output)
     except RuntimeError as exc:
         _logger.error("%s", exc)
         return 1